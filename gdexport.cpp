@@ -112,6 +112,13 @@ class GenerateExtensionInterface : public PluginASTAction
      */
     std::optional<std::string> outputFile;
 
+    /**
+     * Specifies the output directory to write the generated code to, using the name automatically
+     * deduced from the input file (ignored if outputFile is set). Allows a single clang invocation
+     * to process multiple header files
+     */
+    std::optional<std::string> outputDir;
+
     /**
      * Specifies the output directory to write XML documentation to (or empty to not write documentation)
      *
@@ -125,7 +132,7 @@ class GenerateExtensionInterface : public PluginASTAction
     bool extractClassNames;
 
 public:
-    GenerateExtensionInterface() : outputFile(), doc(), extractClassNames(false) {}
+    GenerateExtensionInterface() : outputFile(), outputDir(), doc(), extractClassNames(false) {}
 
     /**
      * Create the consumer for handling the AST
@@ -149,6 +156,12 @@ public:
         if(file != "-")
         {
             std::filesystem::path path(file.data());
+            if(!outputFile && outputDir)
+            {
+                std::filesystem::path output = std::filesystem::path(*outputDir) / path.filename();
+                output.replace_extension(".gen.cpp");
+                outputFile = output.generic_string();
+            }
             if(!outputFile)
             {
                 header = path.filename();
@@ -223,6 +236,20 @@ public:
                     return false;
                 }
             }
+            else if(args[i] == "-outdir")
+            {
+                ++i;
+                if(i != size)
+                {
+                    outputDir = args[i];
+                }
+                else
+                {
+                    diag.Report(diag.getCustomDiagID(DiagnosticsEngine::Error,
+                        "missing -outdir argument"));
+                    return false;
+                }
+            }
             else if(args[i] == "-doc")
             {
                 ++i;
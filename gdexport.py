@@ -24,9 +24,96 @@ import subprocess
 import re
 import pathlib
 import os
+import shutil
+import functools
+import contextlib
+import atexit
+import itertools
+import math
 from importlib import resources
 import platform
 
+try:
+    # Optional: faster hashing of the header contents for the cache of generated files
+    import xxhash
+except ImportError:
+    xxhash = None
+
+_CLANG_VERSION_RE = re.compile(r"clang.*?(([0-9]+)((?:[.](?:[0-9]+))*))")
+# The paths in a dependency file written by clang (`-MD`), in which spaces and '#' are escaped
+# by '\'; and those escapes, to remove from each path
+_DEPFILE_TOKEN_RE = re.compile(r"(?:\\[ #]|\S)+")
+_DEPFILE_ESCAPE_RE = re.compile(r"\\([ #])")
+# Translation table replacing every byte which is not [a-zA-Z0-9_] with '_'; i.e., the same
+# replacement the plugin applies to (the bytes of) a header file name to derive its function name
+_IDENTIFIER_TABLE = bytes(c if (chr(c).isascii() and chr(c).isalnum()) else ord('_') for c in range(256))
+
+# Options for all clang subprocesses: clang never reads stdin; and on POSIX the child does not
+# need to close every inherited file descriptor, as Python creates its own file descriptors
+# (including the subprocess pipes) as non-inheritable
+_SUBPROCESS_OPTIONS = {"stdin": subprocess.DEVNULL, "close_fds": os.name != "posix"}
+
+# Clang executables (as specified by the caller) which have been successfully checked by
+# `_check_clang_version`, so functions which only need the check can skip it
+_verified_clangs : set[str] = set()
+
+# Templates for the C++ source file containing the entry point of the GDExtension (see `_entry_point`)
+_ENTRY_POINT_PROLOGUE = ('#include <gdextension_interface.h>\n'
+                         '#include <godot_cpp/core/defs.hpp>\n'
+                         '#include <godot_cpp/godot.hpp>\n'
+                         '\n'
+                         'using namespace godot;\n'
+                         '\n')
+_ENTRY_POINT_INITIALIZE = ('\n'
+                           'void initialize_{name}_module(ModuleInitializationLevel p_level)\n'
+                           '{{\n'
+                           '    if(p_level != MODULE_INITIALIZATION_LEVEL_SCENE)\n'
+                           '    {{\n'
+                           '        return;\n'
+                           '    }}\n')
+_ENTRY_POINT_EPILOGUE = ('}}\n'
+                         '\n'
+                         'void uninitialize_{name}_module(ModuleInitializationLevel p_level)\n'
+                         '{{\n'
+                         '    if(p_level != MODULE_INITIALIZATION_LEVEL_SCENE)\n'
+                         '    {{\n'
+                         '        return;\n'
+                         '    }}\n'
+                         '}}\n'
+                         '\n'
+                         'extern "C"\n'
+                         '{{\n'
+                         'GDExtensionBool GDE_EXPORT {name}_library_init('
+                         'GDExtensionInterfaceGetProcAddress p_get_proc_address, '
+                         'const GDExtensionClassLibraryPtr p_library,'
+                         'GDExtensionInitialization *r_initialization)\n'
+                         '{{\n'
+                         '    godot::GDExtensionBinding::InitObject init_obj(p_get_proc_address, p_library, r_initialization);\n'
+                         '    init_obj.register_initializer(initialize_{name}_module);\n'
+                         '    init_obj.register_terminator(uninitialize_{name}_module);\n'
+                         '    init_obj.set_minimum_library_initialization_level(MODULE_INITIALIZATION_LEVEL_SCENE);\n'
+                         '    return init_obj.init();\n'
+                         '}}\n'
+                         '}}\n')
+
+# File name of the clang plugin library for the current platform
+_PLUGIN_LIB = {
+    "Linux": 'libgdexport.so',
+    "Darwin": 'libgdexport.dylib',
+    "Windows": 'gdexport.dll'
+}.get(platform.system(), 'libgdexport.so')
+
+@functools.cache
+def _plugin_resource():
+    """
+    Gets the resource (importlib.resources.abc.Traversable) for the clang plugin library, which is
+    only looked up once
+    """
+    if __package__ is None:
+        return resources.files("lib") / _PLUGIN_LIB
+    else:
+        return resources.files(__package__) / "lib" / _PLUGIN_LIB
+
 def _get_plugin_path():
     """
     Gets a context manager object for the resource file for the clang plugin:
@@ -36,20 +123,20 @@ def _get_plugin_path():
         # 'plugin' is now the path to the plugin
     ```
     """
-    gdexport_plugin_lib = ''
-    match platform.system():
-        case "Linux":
-            gdexport_plugin_lib = 'libgdexport.so'
-        case "Darwin":
-            gdexport_plugin_lib = 'libgdexport.dylib'
-        case "Windows":
-            gdexport_plugin_lib = 'gdexport.dll'
-        case _:
-            gdexport_plugin_lib = 'libgdexport.so'
-    if __package__ is None:
-        return resources.as_file(resources.files("lib") / gdexport_plugin_lib)
-    else:
-        return resources.as_file(resources.files(__package__) / "lib" / gdexport_plugin_lib)
+    return resources.as_file(_plugin_resource())
+
+# Keeps the plugin library file (which may have been extracted to a temporary file) available
+# until the interpreter exits; see `_plugin_path`
+_plugin_files = contextlib.ExitStack()
+atexit.register(_plugin_files.close)
+
+@functools.cache
+def _plugin_path() -> pathlib.Path:
+    """
+    Gets the path to the clang plugin. If the plugin is not directly on the file system (e.g., the
+    package is zipped) it is extracted once per process, rather than on every use
+    """
+    return _plugin_files.enter_context(_get_plugin_path())
 
 def _dest_folder(folder : str|None, create_folders : bool, desc : str) -> pathlib.Path|None:
     """
@@ -65,27 +152,66 @@ def _dest_folder(folder : str|None, create_folders : bool, desc : str) -> pathli
     """
     if folder:
         dest = pathlib.Path(str(folder))
-        if not dest.exists():
-            if create_folders:
-                os.makedirs(str(folder))
+        if not os.path.isdir(dest):
+            if os.path.lexists(dest):
+                raise NotADirectoryError("The specified {} path is not a folder".format(desc))
+            elif create_folders:
+                # exist_ok, as a concurrent build may create the folder after the check
+                os.makedirs(dest, exist_ok=True)
             else:
                 raise FileExistsError("The specified {} path does not exist".format(desc))
-        elif not dest.is_dir():
-            raise NotADirectoryError("The specified {} path is not a folder".format(desc))
         return dest
     else:
         return None
 
+def _check_files(files : list[str]):
+    """
+    Checks that files are specified and that each of the specified files exist
+
+    :param list[str] files: List of files to check
+
+    :raises ValueError: If no files are specified, or a specified file does not exist
+    """
+    if len(files) == 0:
+        raise ValueError("No files to process are specified")
+    for file in files:
+        try:
+            os.stat(str(file))
+        except (FileNotFoundError, NotADirectoryError):
+            raise ValueError("Specified file does not exist: "+str(file)) from None
+
+def _check_jobs(jobs : int|None):
+    """
+    Checks that the maximum number of parallel jobs is valid
+
+    :param int|None jobs: Maximum number of parallel jobs, or `None` for the number of CPUs
+
+    :raises ValueError: If `jobs` is less than 1
+    """
+    if jobs is not None and jobs < 1:
+        raise ValueError("Number of jobs must be at least 1: {}".format(jobs))
+
+def _generated_name(file : str) -> str:
+    """
+    Gets the name of the generated C++ source file for the specified header file; i.e., the name of
+    the header file with the extension replaced by `.gen.cpp`
+    """
+    return os.path.splitext(os.path.basename(str(file)))[0]+".gen.cpp"
+
 def validate_name(name : str):
     """
     Checks if the specified name is a valid C++ identifier
     """
-    return re.match('^[a-zA-Z_][a-zA-Z0-9_]*$', name) is not None
+    # An ASCII Python identifier is exactly [a-zA-Z_][a-zA-Z0-9_]*
+    return name.isidentifier() and name.isascii()
 
 def _check_clang_version(clang : str):
     """
     Check if the specified path actually points to a valid version of clang
 
+    The result is cached per resolved executable (and its modification time), so
+    `clang --version` is only run once per interpreter session for each clang
+
     :todo: Check version number
 
     :param str clang: Path (relative, absolute, or exe name in PATH) to the clang executable
@@ -94,8 +220,31 @@ def _check_clang_version(clang : str):
 
     :return: The version number of the specified clang executable
     """
-    check_version = subprocess.run([str(clang), "--version"], capture_output=True, encoding="utf-8", check=True)
-    version = re.search(r"clang.*?(([0-9]+)((?:[.](?:[0-9]+))*))", check_version.stdout)
+    executable = shutil.which(str(clang))
+    if executable is None:
+        # Not found; let subprocess raise the appropriate error
+        return _clang_version.__wrapped__(str(clang), 0)
+    executable = os.path.realpath(executable)
+    version = _clang_version(executable, os.stat(executable).st_mtime_ns)
+    _verified_clangs.add(str(clang))
+    return version
+
+@functools.lru_cache(maxsize=8)
+def _clang_version(clang : str, mtime : int):
+    """
+    Runs `clang --version` and extracts the version number; see `_check_clang_version`
+
+    :param str clang: Resolved path to the clang executable
+    :param int mtime: Modification time of the clang executable (only used as part
+                      of the cache key)
+
+    :raises subprocess.CalledProcessError: if the return from `clang --version` is invalid
+
+    :return: The version number of the specified clang executable
+    """
+    check_version = subprocess.run([clang, "--version"], capture_output=True, encoding="utf-8", check=True,
+                                   **_SUBPROCESS_OPTIONS)
+    version = _CLANG_VERSION_RE.search(check_version.stdout)
     if not version:
         raise subprocess.CalledProcessError(0, "clang --version", check_version.stdout,
                                             check_version.stderr)
@@ -118,59 +267,285 @@ def _load_godot_paths(godot : str|None, sysincludes : list[str]) -> list[str]:
         sysincludes.append(str(godot_path / "gen/include"))
     return sysincludes
 
+@functools.lru_cache(maxsize=32)
 def _load_arguments(clang          : str,
                     plugin         : pathlib.Path,
-                    sysincludes    : list[str],
-                    includes       : list[str],
+                    sysincludes    : tuple[str,...],
+                    includes       : tuple[str,...],
                     documentation  : str|None,
-                    args           : list[str]) -> list[str]:
+                    args           : tuple[str,...]) -> tuple[str,...]:
     """
-    Generates the argument list for calling clang with the plugin to process a header file
+    Generates the argument list for calling clang with the plugin to process a header file.
+    The result is cached, as a build system will typically call with the same arguments many times
 
     :param str clang:              Path (relative, absolute, or exe name in PATH) to the clang executable
     :param str plugin:             Path to the plugin for gdexport
-    :param list[str] sysincludes:  List of paths to treat as system include directories;
+    :param tuple[str] sysincludes: Paths to treat as system include directories;
                                    i.e., `-isystem` paths to Clang
-    :param list[str] includes:     List of paths to treat as normal include directories;
+    :param tuple[str] includes:    Paths to treat as normal include directories;
                                    i.e., `-I` paths to Clang
     :param str|None documentation: Specify whether to also extract Doxygen style comments from the
                                    C++ source and generate the Godot XML documentation for the extension.
-    :param list[str] args:         List of extra command line arguments to pass to clang
+    :param tuple[str] args:        Extra command line arguments to pass to clang
 
-    :return: List of arguments (strings) to pass to `subprocess` run methods to run clang. The last
-             two arguments of the returned array will be the empty string and should be replaced with
-             the output and input file paths, respectively, for the header file to process
+    :return: Tuple of arguments (strings) to pass to `subprocess` run methods to run clang. The
+             output arguments for the plugin (see `_plugin_arguments`) and the header file(s)
+             to process should be appended
     """
     arguments = [str(clang), "-fsyntax-only", "-Xclang", "-std=c++17",
                  "-Xclang", "-DGDEXPORT_GENERATING", "-fplugin="+str(plugin)]
-    for inc in sysincludes:
-        arguments += ["-Xclang", "-isystem", "-Xclang", str(inc)]
-    for inc in includes:
-        arguments += ["-Xclang", "-I", "-Xclang", str(inc)]
-    arguments += [y for x in args for y in ("-Xclang", str(x))]
+    arguments.extend(itertools.chain(
+        itertools.chain.from_iterable(("-Xclang", "-isystem", "-Xclang", str(inc)) for inc in sysincludes),
+        itertools.chain.from_iterable(("-Xclang", "-I", "-Xclang", str(inc)) for inc in includes),
+        itertools.chain.from_iterable(("-Xclang", str(arg)) for arg in args)
+    ))
     if documentation:
-        arguments += [
-            "-Xclang", "-plugin-arg-gdexport", "-Xclang", "-doc",
-            "-Xclang", "-plugin-arg-gdexport", "-Xclang", str(documentation)
-        ]
-    arguments += [
-        "-Xclang", "-plugin-arg-gdexport", "-Xclang", "-out",
-        "-Xclang", "-plugin-arg-gdexport", "-Xclang", ""
-    ]
-    arguments.append("")
-    return arguments
+        arguments += _plugin_arguments("-doc", documentation)
+    return tuple(arguments)
+
+def _plugin_arguments(*args) -> list[str]:
+    """
+    Generates the clang arguments to pass the specified arguments to the gdexport plugin
+
+    :param args: Arguments to pass to the plugin (converted to strings)
+
+    :return: List of arguments (strings) to pass to clang
+    """
+    return [y for x in args for y in ("-Xclang", "-plugin-arg-gdexport", "-Xclang", str(x))]
+
+def _read_dependencies(depfile : str) -> list[str]:
+    """
+    Reads the files listed in a (Makefile style) dependency file written by clang (`-MD -MF`)
+
+    :param str depfile: Path to the dependency file
+
+    :raises FileNotFoundError: If the dependency file does not exist
+
+    :return: List of the paths of the dependencies (excluding the target)
+    """
+    with open(depfile, 'r', encoding='utf-8', errors='surrogateescape') as f:
+        text = f.read().replace('\\\r\n', ' ').replace('\\\n', ' ')
+    # The target is separated from its dependencies by ': ' (a Windows drive is followed by '\')
+    _,_,dependencies = text.partition(': ')
+    return [_DEPFILE_ESCAPE_RE.sub(r'\1', x).replace('$$', '$')
+            for x in _DEPFILE_TOKEN_RE.findall(dependencies)]
+
+def _modified_since(files : list[str], mtime_ns : int) -> bool:
+    """
+    Checks whether any of the specified files has been modified after the specified time,
+    or no longer exists
+
+    :param list[str] files: The files to check
+    :param int mtime_ns:    The time to compare against, in nanoseconds
+
+    :return: `True` if any file has been modified after `mtime_ns` or does not exist; otherwise `False`
+    """
+    try:
+        return any(os.stat(x).st_mtime_ns > mtime_ns for x in files)
+    except FileNotFoundError:
+        return True
+
+def _precompile_godot(arguments : tuple[str,...], version : str, folder : pathlib.Path, quiet : bool) -> str:
+    """
+    Generates (if necessary) a precompiled header for the `godot-cpp` headers (`godot_cpp/godot.hpp`),
+    which can be passed to clang with `-include-pch` so the headers are parsed once rather than for
+    every header file processed. The precompiled header is generated again if any of the headers it
+    includes (listed in the dependency file clang writes alongside it) has been modified since
+
+    :param tuple[str] arguments: The arguments returned by `_load_arguments` (without documentation)
+    :param str version:          The version of clang (the precompiled header is specific to it)
+    :param pathlib.Path folder:  Folder to write the precompiled header (and its source) to
+    :param bool quiet:           Specifies whether to suppress status messages
+
+    :raises subprocess.CalledProcessError: if an error occurs when calling `clang`
+
+    :return: Path to the precompiled header
+    """
+    import hashlib
+    import tempfile
+    # Name the file by the options, so different options do not share an (incompatible) header
+    key = hashlib.sha256(repr((arguments, version)).encode('utf-8')).hexdigest()[:16]
+    source = folder / "gdexport-{}.hpp".format(key)
+    pch = folder / "gdexport-{}.pch".format(key)
+    depfile = folder / "gdexport-{}.d".format(key)
+
+    try:
+        stale = _modified_since(_read_dependencies(depfile), os.stat(pch).st_mtime_ns)
+    except FileNotFoundError:
+        stale = True
+    if stale:
+        if not quiet:
+            print(f" - Precompiling godot-cpp headers > {pch}")
+        stub = b'#include <godot_cpp/godot.hpp>\n'
+        if not os.path.exists(source) or source.read_bytes() != stub:
+            # Write to a temporary file and rename, as a concurrent run may be precompiling it
+            fd,temp = tempfile.mkstemp(suffix=".hpp", dir=folder)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(stub)
+            os.replace(temp, source)
+        # Same options as processing the header files, but emitting a precompiled header and
+        # without the plugin (in -nameonly mode it suppresses errors for missing includes, so
+        # a header precompiled from a missing or unbuilt godot-cpp would appear valid)
+        fd,temp = tempfile.mkstemp(suffix=".pch", dir=folder)
+        os.close(fd)
+        tempdeps = temp+".d"
+        try:
+            subprocess.run([arguments[0], "-x", "c++-header",
+                            *(x for x in arguments[1:] if x != "-fsyntax-only" and not x.startswith("-fplugin=")),
+                            str(source), "-o", temp, "-MD", "-MF", tempdeps],
+                           check=True, stdout=subprocess.DEVNULL, **_SUBPROCESS_OPTIONS)
+            # Replace the dependencies first, so an interrupted replace leaves a stale header
+            os.replace(tempdeps, depfile)
+            os.replace(temp, pch)
+        finally:
+            for x in (temp, tempdeps):
+                if os.path.exists(x):
+                    os.remove(x)
+    return str(pch)
+
+@functools.cache
+def _cpu_count() -> int:
+    """
+    Gets the number of CPUs the process may run on (which may be less than the number of
+    CPUs in the system; e.g., restricted by `taskset` or a container), used as the default
+    number of parallel jobs
+    """
+    if hasattr(os, "process_cpu_count"):
+        return os.process_cpu_count() or 1
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+def _map_jobs(function, iterable, jobs : int|None) -> list:
+    """
+    Applies the specified function to each item, running up to `jobs` calls in parallel. As the
+    work is done by clang subprocesses, threads are sufficient to run the calls concurrently
+
+    :param function:         Function to call for each item
+    :param iterable:         Items to call the function for
+    :param int|None jobs:    Maximum number of calls to run in parallel; `None` for the number
+                             of CPUs available; `1` calls sequentially in the current thread
+
+    :return: List of the results of calling the function, in the same order as the input items
+    """
+    items = list(iterable)
+    # No thread pool (nor its import) for a single item; e.g., the SCons doc emitter listing one header
+    if jobs == 1 or len(items) <= 1:
+        return [function(x) for x in items]
+    import concurrent.futures
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(jobs or _cpu_count(), len(items))) as executor:
+        return list(executor.map(function, items))
+
+def _cache_folder(cache : str|None) -> pathlib.Path|None:
+    """
+    Gets a pathlib.Path path to the cache folder for generated files, creating it if necessary,
+    or None if caching is disabled
+
+    :param str|None cache: Path to the cache folder, `""` (empty string) for the default location
+                           (`$XDG_CACHE_HOME/gdexport` or `~/.cache/gdexport`), or `None` to disable
+
+    :raises NotADirectoryError: If the cache folder is a file
+    :raises OSError:            If the cache folder does not exist and the folder creation failed
+    """
+    if cache is None:
+        return None
+    if cache == "":
+        cache = pathlib.Path(os.environ.get("XDG_CACHE_HOME") or pathlib.Path.home() / ".cache") / "gdexport"
+    return _dest_folder(cache, True, "cache")
+
+def _cache_key(file : str, output : str, *args) -> str:
+    """
+    Computes the key of the cache entry for the generated files of a header file
+
+    :param str file:   The C++ header file to process
+    :param str output: The file to output the generated code to
+    :param args:       Any other values (converted with `repr`) which the generated files depend on
+
+    :return: The key (hex digest of a hash of the header file contents and the other values)
+    """
+    import hashlib
+    key = xxhash.xxh3_128() if xxhash else hashlib.sha256()
+    key.update(pathlib.Path(str(file)).read_bytes())
+    for x in (os.path.abspath(str(file)), os.path.abspath(str(output))) + args:
+        key.update(b"\0"+repr(x).encode('utf-8'))
+    return key.hexdigest()
+
+def _cache_load(cache : pathlib.Path, key : str, output : str, docdest : pathlib.Path|None) -> list[str]|None:
+    """
+    Copies the generated files of an entry in the cache of generated files to their destinations.
+    An entry is the generated C++ source file (`<key>.gen.cpp`) and, if documentation was generated,
+    a folder of the XML documentation files (`<key>.docs`)
+
+    :param pathlib.Path cache:           Path to the cache folder
+    :param str key:                      Key of the entry; see `_cache_key`
+    :param str output:                   The file to copy the generated code to
+    :param pathlib.Path|None docdest:    Folder to copy the XML documentation files to, or `None`
+
+    :return: List of the XML documentation files copied to `docdest` (empty if `docdest` is `None`),
+             or `None` if there is no valid entry for the key
+    """
+    try:
+        docs = []
+        if docdest:
+            folder = cache / (key+".docs")
+            for doc in os.listdir(folder):
+                docs.append(os.path.join(docdest, doc))
+                shutil.copyfile(folder / doc, docs[-1])
+        shutil.copyfile(cache / (key+".gen.cpp"), output)
+        return docs
+    except OSError:
+        return None
+
+def _cache_store(cache : pathlib.Path, key : str, output : str, docs : list[str]|None):
+    """
+    Stores the generated files for a header file in the cache. Storing is only an optimisation, so
+    an entry which cannot be stored (e.g. a conflicting or malformed entry exists) is skipped
+
+    :param pathlib.Path cache:  Path to the cache folder
+    :param str key:             Key of the entry; see `_cache_key`
+    :param str output:          The file the generated code was written to
+    :param list[str]|None docs: The XML documentation files generated for the header file
+    """
+    import tempfile
+    # Copy to temporary files and rename, so concurrent runs never see a partial entry; the
+    # source file is stored last, as its presence marks the entry as complete
+    temps = []
+    try:
+        if docs is not None:
+            temps.append(tempfile.mkdtemp(suffix=".tmp", dir=cache))
+            for doc in docs:
+                shutil.copyfile(doc, os.path.join(temps[-1], os.path.basename(doc)))
+            if not os.path.isdir(cache / (key+".docs")):
+                os.replace(temps[-1], cache / (key+".docs"))
+        fd,temp = tempfile.mkstemp(suffix=".tmp", dir=cache)
+        os.close(fd)
+        temps.append(temp)
+        shutil.copyfile(output, temp)
+        os.replace(temp, cache / (key+".gen.cpp"))
+    except OSError:
+        pass
+    finally:
+        for temp in temps:
+            if os.path.isdir(temp):
+                shutil.rmtree(temp, ignore_errors=True)
+            elif os.path.exists(temp):
+                os.remove(temp)
 
 def generate_all(name           : str,
                  files          : list[str],
-                 godot          : str|None  = 'godot-cpp',
-                 clang          : str       = "clang",
-                 sysincludes    : list[str] = [],
-                 includes       : list[str] = [],
-                 destination    : str|None  = None,
-                 documentation  : str|None  = None,
-                 create_folders : bool = True,
-                 quiet          : bool = False,
-                 args           : list[str] = []) -> tuple[list[str],list[str]|None,str]:
+                 godot          : str|None       = 'godot-cpp',
+                 clang          : str            = "clang",
+                 sysincludes    : list[str]|None = None,
+                 includes       : list[str]|None = None,
+                 destination    : str|None       = None,
+                 documentation  : str|None       = None,
+                 create_folders : bool           = True,
+                 quiet          : bool           = False,
+                 args           : list[str]|None = None,
+                 jobs           : int|None       = None,
+                 cache          : str|None       = None,
+                 precompile     : bool           = False,
+                 incremental    : bool           = False) -> tuple[list[str],list[str]|None,str]:
     """
     Generates C++ source files which export the C++ classes, methods, enums,
     signals, etc., marked with `godot::` attributes to be accessible via a
@@ -208,10 +583,28 @@ def generate_all(name           : str,
                                    (`destination` and `documentation`) if they do not exist
     :param bool quiet:             Specifies whether to suppress status messages
     :param list[str] args:         List of extra command line arguments to pass to clang
+    :param int|None jobs:          Maximum number of clang processes to run in parallel
+                                   (default = `None` for the number of CPUs)
+    :param str|None cache:         Specify whether to cache the generated files, keyed by the
+                                   contents of the header file and the clang options, and reuse
+                                   them rather than calling clang when the same header is processed
+                                   again. Specify `None` to not cache, `""` (empty string) to use
+                                   the default location (`~/.cache/gdexport`), or path to directory
+                                   to store the cache in otherwise. Note that changes to other
+                                   headers included by a header do not invalidate its cache entry.
+    :param bool precompile:        Specify whether to precompile the `godot-cpp` headers
+                                   (`godot_cpp/godot.hpp`) once, and reuse the precompiled header
+                                   for every header file. The precompiled header is stored in the
+                                   `cache` folder if specified; otherwise, in the `destination` folder.
+    :param bool incremental:       Specify whether to skip header files whose generated file is newer
+                                   than the header file, the clang plugin, and this module. Ignored
+                                   when generating documentation. Note that changes to other headers
+                                   included by a header, or to the options, are not detected.
 
     :raises ValueError:         If name is not a valid C++ identifier (valid identifier
                                 contains only [a-zA-Z0-9_] and cannot start with a number)
     :raises ValueError:         If no files are specified, or a specified file does not exist
+    :raises ValueError:         If `jobs` is less than 1
     :raises FileExistsError:    If `destination` or `documentation` folder does not exist,
                                 and `create_folders` is `False`
     :raises NotADirectoryError: If `destination` or `documentation` folder is a file
@@ -232,12 +625,8 @@ def generate_all(name           : str,
     if not validate_name(name):
         raise ValueError("Specified name is not a valid C++ identifier: "+name)
 
-    if len(files) == 0:
-        raise ValueError("No files to process are specified")
-    for file in files:
-        filepath = pathlib.Path(str(file))
-        if not filepath.exists():
-            raise ValueError("Specified file does not exist: "+str(file))
+    _check_files(files)
+    _check_jobs(jobs)
 
     version = _check_clang_version(clang)
     if not quiet:
@@ -249,29 +638,85 @@ def generate_all(name           : str,
     if documentation == "":
         documentation = "doc_classes"
     docdest = _dest_folder(documentation, create_folders, 'documentation')
+    cachedest = _cache_folder(cache)
 
-    sysincludes = _load_godot_paths(godot, sysincludes)
+    sysincludes = _load_godot_paths(godot, list(sysincludes) if sysincludes else [])
+    includes = list(includes) if includes else []
+    args = list(args) if args else []
 
     result = []
     docs = []
-    with _get_plugin_path() as library:
-        arguments = _load_arguments(clang, library, sysincludes, includes, documentation, args)
-
-        for file in files:
-            filepath = pathlib.Path(str(file))
-            destfile = filepath.with_suffix(".gen.cpp").name
-            if dest:
-                destfile = str(dest / destfile)
-            arguments[-2] = destfile
-            result.append(destfile)
-
-            if not quiet:
-                print(" - Processing {} > {}".format(str(file), destfile))
-            arguments[-1] = str(file)
-            generated,generated_docs = _export_header(arguments, docdest)
-            result.append(generated)
-            if generated_docs:
-                docs += generated_docs
+    library = _plugin_path()
+    # The documentation files are only known by running clang, so every file is processed
+    if incremental and not docdest:
+        # A generated file is out of date if older than its header, or the code generating it
+        generator = os.stat(library).st_mtime_ns
+        try:
+            generator = max(generator, os.stat(__file__).st_mtime_ns)
+        except OSError:
+            # This module is not a file on disk (e.g. imported from a zip archive); the plugin is
+            # then extracted from the archive, so its time is no older than the package
+            pass
+    else:
+        generator = None
+
+    pending = []
+    for file in files:
+        destfile = _generated_name(file)
+        if dest:
+            destfile = os.path.join(dest, destfile)
+        result.append(destfile)
+
+        if generator is not None:
+            try:
+                if os.stat(destfile).st_mtime_ns > max(generator, os.stat(file).st_mtime_ns):
+                    if not quiet:
+                        print(f" - Processing {file} > {destfile} (up to date)")
+                    continue
+            except FileNotFoundError:
+                pass
+
+        key = None
+        if cachedest:
+            key = _cache_key(file, destfile, sysincludes, includes, args, str(docdest),
+                             os.stat(library).st_mtime_ns, version)
+            cached_docs = _cache_load(cachedest, key, destfile, docdest)
+            if cached_docs is not None:
+                if not quiet:
+                    print(f" - Processing {file} > {destfile} (cached)")
+                docs += cached_docs
+                continue
+        if not quiet:
+            print(f" - Processing {file} > {destfile}")
+        pending.append((file, destfile, key))
+
+    arguments = [*_load_arguments(clang, library, tuple(sysincludes), tuple(includes), documentation, tuple(args)),
+                 *_plugin_arguments("-outdir", dest if dest else ".")]
+    if precompile and pending:
+        pch = _precompile_godot(_load_arguments(clang, library, tuple(sysincludes), tuple(includes), None, tuple(args)),
+                                version, cachedest or dest or pathlib.Path(), quiet)
+        arguments += ["-Xclang", "-include-pch", "-Xclang", pch]
+
+    # Process the files in batches, one clang invocation per batch, to amortise the cost of
+    # starting the clang driver; while still spreading the files over the jobs.
+    # When caching documentation each file is processed separately, as the list of
+    # generated XML files must be known per header file
+    if cachedest and docdest:
+        batch_size = 1
+    else:
+        batch_size = max(1, min(2*_cpu_count(), math.ceil(len(pending)/(jobs or _cpu_count()))))
+    batches = [pending[start:start+batch_size] for start in range(0, len(pending), batch_size)]
+
+    def export_batch(batch):
+        generated_docs = _export_headers(arguments + [str(file) for file,_,_ in batch], docdest)
+        if cachedest:
+            for _,destfile,key in batch:
+                _cache_store(cachedest, key, destfile, generated_docs)
+        return generated_docs
+
+    for generated_docs in _map_jobs(export_batch, batches, jobs):
+        if generated_docs:
+            docs += generated_docs
 
     library_cpp = name+".lib.cpp"
     if dest:
@@ -285,39 +730,41 @@ def generate_all(name           : str,
     else:
         return result,None,entry
 
-def _export_header(arguments : list[str], documentation : pathlib.Path|None) -> tuple[str,list[str]|None]:
+def _export_headers(arguments : list[str], documentation : pathlib.Path|None) -> list[str]|None:
     """
-    Call clang with the plugin to process a header file
+    Call clang with the plugin to process one or more header files
 
     :param list[str] arguments: The arguments to pass to `subprocess` to run clang; i.e., the
-                                arguments returned by `_load_arguments` with the last two arguments
-                                replaced with output and input file for the header file to process
+                                arguments returned by `_load_arguments` with the output arguments
+                                for the plugin and the header file(s) to process appended
     :param pathlib.Path|None documentation: Path to documentation output folder, or None for no doc output
 
     :raises subprocess.CalledProcessError: if an error occurs when calling `clang`
 
-    :return: Two-tuple containing:
-               - String containing the file path/name of the generated C++ source file
-               - If `documentation` is not `None` then a list of strings containing the file
-                 paths/names of the generated XML documentation files; otherwise None
+    :return: If `documentation` is not `None` then a list of strings containing the file
+             paths/names of the generated XML documentation files; otherwise None
     """
     if documentation:
-        result = subprocess.check_output(arguments, encoding='utf-8')
-        return arguments[-2],[str(documentation/(x.strip()+".xml")) for x in result.splitlines() if x.strip() != '']
+        # Read the class names as clang prints them, rather than buffering the whole output
+        with subprocess.Popen(arguments, stdout=subprocess.PIPE, encoding='utf-8', **_SUBPROCESS_OPTIONS) as process:
+            docs = [os.path.join(documentation, name+".xml") for line in process.stdout if (name := line.strip())]
+        if process.returncode:
+            raise subprocess.CalledProcessError(process.returncode, arguments)
+        return docs
     else:
-        subprocess.run(arguments, check=True)
-        return arguments[-2],None
+        subprocess.run(arguments, check=True, **_SUBPROCESS_OPTIONS)
+        return None
 
 def export_header(file           : str,
-                  output         : str|None  = None,
-                  godot          : str|None  = 'godot-cpp',
-                  clang          : str       = "clang",
-                  sysincludes    : list[str] = [],
-                  includes       : list[str] = [],
-                  destination    : str|None  = None,
-                  documentation  : str|None  = None,
-                  create_folders : bool      = True,
-                  args           : list[str] = []) -> tuple[str,list[str]|None]:
+                  output         : str|None       = None,
+                  godot          : str|None       = 'godot-cpp',
+                  clang          : str            = "clang",
+                  sysincludes    : list[str]|None = None,
+                  includes       : list[str]|None = None,
+                  destination    : str|None       = None,
+                  documentation  : str|None       = None,
+                  create_folders : bool           = True,
+                  args           : list[str]|None = None) -> tuple[str,list[str]|None]:
     """
     Generates a C++ source file, and optionally XML documentation, which export the C++ classes,
     methods, enums, signals, etc., marked with `godot::` attributes from the specified C++ header file.
@@ -366,27 +813,27 @@ def export_header(file           : str,
                - If `documentation` is not `None` then a list of strings containing the file
                  paths/names of the generated XML documentation files; otherwise None
     """
-    _check_clang_version(clang)
+    if str(clang) not in _verified_clangs:
+        _check_clang_version(clang)
 
-    filepath = pathlib.Path(str(file))
-    if not filepath.exists():
-        raise ValueError("Specified file does not exist: "+str(file))
+    _check_files([file])
     if not output:
         dest = _dest_folder(destination, create_folders, "destination")
-        output = filepath.with_suffix(".gen.cpp").name
+        output = _generated_name(file)
         if dest:
-            output = str(dest / output)
+            output = os.path.join(dest, output)
     if documentation == "":
         documentation = "doc_classes"
     docdest = _dest_folder(documentation, create_folders, 'documentation')
 
-    sysincludes = _load_godot_paths(godot, sysincludes)
+    sysincludes = _load_godot_paths(godot, list(sysincludes) if sysincludes else [])
+    includes = list(includes) if includes else []
+    args = list(args) if args else []
 
-    with _get_plugin_path() as library:
-        arguments = _load_arguments(clang, library, sysincludes, includes, documentation, args)
-        arguments[-2] = str(output)
-        arguments[-1] = str(file)
-        return _export_header(arguments, docdest)
+    library = _plugin_path()
+    arguments = [*_load_arguments(clang, library, tuple(sysincludes), tuple(includes), documentation, tuple(args)),
+                 *_plugin_arguments("-out", output), str(file)]
+    return str(output),_export_headers(arguments, docdest)
 
 def _entry_point(name : str, files : list[str], output : str) -> str:
     """
@@ -395,7 +842,7 @@ def _entry_point(name : str, files : list[str], output : str) -> str:
 
     See README.md for details on the attributes necessary for the export.
 
-    :param str name:         Name of the GDExtension.
+    :param str name:         Name of the GDExtension (already checked by `validate_name`)
     :param list[str] files:  List of C++ header files for which files have been (or will be)
                              generated
     :param stroutput:        Specifies the file to output the generated code to.
@@ -403,50 +850,18 @@ def _entry_point(name : str, files : list[str], output : str) -> str:
     :return: The name of the C++ function generated as the extension's entry point;
              i.e., the value returned by `entry_point_name`
     """
-    ids = [re.sub("[^a-zA-Z0-9_]", '_', pathlib.Path(str(x)).stem) for x in files]
-    with open(str(output), 'w', encoding='utf-8') as f:
-        f.write('#include <gdextension_interface.h>\n'
-                '#include <godot_cpp/core/defs.hpp>\n'
-                '#include <godot_cpp/godot.hpp>\n'
-                '\n'
-                'using namespace godot;\n'
-                '\n')
-        for identifier in ids:
-            f.write('void initialize_{0}();\n'.format(identifier))
-        f.write(('\n'
-                 'void initialize_{0}_module(ModuleInitializationLevel p_level)\n'
-                 '{{\n'
-                 '    if(p_level != MODULE_INITIALIZATION_LEVEL_SCENE)\n'
-                 '    {{\n'
-                 '        return;\n'
-                 '    }}\n').format(name))
-        for identifier in ids:
-            f.write('    initialize_{0}();\n'.format(identifier))
-        f.write(('}}\n'
-                 '\n'
-                 'void uninitialize_{0}_module(ModuleInitializationLevel p_level)\n'
-                 '{{\n'
-                 '    if(p_level != MODULE_INITIALIZATION_LEVEL_SCENE)\n'
-                 '    {{\n'
-                 '        return;\n'
-                 '    }}\n'
-                 '}}\n'
-                 '\n'
-                 'extern "C"\n'
-                 '{{\n'
-                 'GDExtensionBool GDE_EXPORT {0}_library_init('
-                 'GDExtensionInterfaceGetProcAddress p_get_proc_address, '
-                 'const GDExtensionClassLibraryPtr p_library,'
-                 'GDExtensionInitialization *r_initialization)\n'
-                 '{{\n'
-                 '    godot::GDExtensionBinding::InitObject init_obj(p_get_proc_address, p_library, r_initialization);\n'
-                 '    init_obj.register_initializer(initialize_{0}_module);\n'
-                 '    init_obj.register_terminator(uninitialize_{0}_module);\n'
-                 '    init_obj.set_minimum_library_initialization_level(MODULE_INITIALIZATION_LEVEL_SCENE);\n'
-                 '    return init_obj.init();\n'
-                 '}}\n'
-                 '}}\n').format(name))
-    return entry_point_name(name)
+    ids = [os.fsencode(os.path.splitext(os.path.basename(str(x)))[0]).translate(_IDENTIFIER_TABLE).decode('ascii')
+           for x in files]
+    parts = [_ENTRY_POINT_PROLOGUE]
+    parts += [f'void initialize_{identifier}();\n' for identifier in ids]
+    parts.append(_ENTRY_POINT_INITIALIZE.format(name=name))
+    parts += [f'    initialize_{identifier}();\n' for identifier in ids]
+    parts.append(_ENTRY_POINT_EPILOGUE.format(name=name))
+    # Encode the whole file once, keeping the platform line endings (as text mode, and the plugin, write)
+    with open(str(output), 'wb') as f:
+        f.write(''.join(parts).replace('\n', os.linesep).encode('utf-8'))
+    # Same as `entry_point_name`, without checking the (already checked) name again
+    return f'{name}_library_init'
 
 def entry_point(name           : str,
                 files          : list[str],
@@ -508,15 +923,16 @@ def entry_point_name(name : str) -> str:
     """
     if not validate_name(name):
         raise ValueError("Specified name is not a valid C++ identifier: "+name)
-    return '{0}_library_init'.format(name)
+    return f'{name}_library_init'
 
 def list_doc_files(files          : list[str],
-                   godot          : str|None  = 'godot-cpp',
-                   clang          : str       = "clang",
-                   sysincludes    : list[str] = [],
-                   includes       : list[str] = [],
-                   documentation  : str|None  = '',
-                   args           : list[str] = []) -> list[str]:
+                   godot          : str|None       = 'godot-cpp',
+                   clang          : str            = "clang",
+                   sysincludes    : list[str]|None = None,
+                   includes       : list[str]|None = None,
+                   documentation  : str|None       = '',
+                   args           : list[str]|None = None,
+                   jobs           : int|None       = None) -> list[str]:
     """
     Gets the list of XML documentation files which will be generated for the specified input files.
 
@@ -535,51 +951,106 @@ def list_doc_files(files          : list[str],
                                    Use `""` (empty string) or 'Non' to generate in default
                                    location (`doc_classes` in current working)
     :param list[str] args:         List of extra command line arguments to pass to clang
+    :param int|None jobs:          Maximum number of clang processes to run in parallel
+                                   (default = `None` for the number of CPUs)
 
     :raises ValueError:         If no files are specified, or a specified file does not exist
+    :raises ValueError:         If `jobs` is less than 1
 
     :return: List of string denoting the path to the XML documentation files which will be created
              by `generate_all` or `export_header`.
     """
+    _check_files(files)
+    _check_jobs(jobs)
 
-    if len(files) == 0:
-        raise ValueError("No files to process are specified")
-    for file in files:
-        filepath = pathlib.Path(str(file))
-        if not filepath.exists():
-            raise ValueError("Specified file does not exist: "+file)
-
-    version = _check_clang_version(clang)
+    if str(clang) not in _verified_clangs:
+        _check_clang_version(clang)
 
     if not documentation:
         documentation = "doc_classes"
-    dest = pathlib.Path(str(documentation))
+    dest = str(pathlib.Path(str(documentation)))
 
-    sysincludes = _load_godot_paths(godot, sysincludes)
+    sysincludes = _load_godot_paths(godot, list(sysincludes) if sysincludes else [])
+    includes = list(includes) if includes else []
+    args = list(args) if args else []
 
     result = []
-    with _get_plugin_path() as library:
-        arguments = [str(clang), "-fsyntax-only", "-Xclang", "-std=c++17",
-                     "-Xclang", "-DGDEXPORT_GENERATING", "-fplugin="+str(library)]
-        for inc in sysincludes:
-            arguments += ["-Xclang", "-isystem", "-Xclang", str(inc)]
-        for inc in includes:
-            arguments += ["-Xclang", "-I", "-Xclang", str(inc)]
-        arguments += [y for x in args for y in ("-Xclang", str(x))]
-        arguments += [
-            "-Xclang", "-plugin-arg-gdexport", "-Xclang", "-nameonly"
-        ]
-        arguments.append("")
-
-        for file in files:
-            arguments[-1] = str(file)
-            output = subprocess.run(arguments, encoding='utf-8', capture_output=True)
-            result += [str(dest/(x.strip()+".xml")) for x in output.stdout.splitlines() if x.strip() != '']
+    library = _plugin_path()
+    arguments = [*_load_arguments(clang, library, tuple(sysincludes), tuple(includes), None, tuple(args)),
+                 *_plugin_arguments("-nameonly")]
+
+    def list_names(file):
+        # Read the class names as clang prints them; errors are ignored (as before) so discard stderr
+        with subprocess.Popen(arguments + [str(file)], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                              encoding='utf-8', **_SUBPROCESS_OPTIONS) as process:
+            return [os.path.join(dest, name+".xml") for line in process.stdout if (name := line.strip())]
+
+    for names in _map_jobs(list_names, files, jobs):
+        result += names
     return result
 
-if __name__ == "__main__":
+@functools.cache
+def _license_text() -> str:
+    """
+    Gets the text of the license (LICENSE.md) of the package
+    """
+    if __package__ is None:
+        return (pathlib.Path(__file__).parent / "LICENSE.md").read_text(encoding='utf-8')
+    else:
+        return (resources.files(__package__) / "LICENSE.md").read_text(encoding='utf-8')
+
+def _positive_int(value : str) -> int:
+    """
+    Convert a command line argument to a positive integer
+
+    :param str value: The argument to convert
+
+    :raises argparse.ArgumentTypeError: If the argument is not an integer of at least 1
+
+    :return: The integer value
+    """
+    import argparse
+
+    try:
+        result = int(value)
+    except ValueError:
+        result = 0
+    if result < 1:
+        raise argparse.ArgumentTypeError("must be a positive integer: '{}'".format(value))
+    return result
+
+def _split_paths(paths : str) -> list[str]:
+    """
+    Split a command line argument containing a list of paths separated by the platform path
+    separator (`:` on POSIX, `;` on Windows)
+
+    :param str paths: The paths to split
+
+    :return: List of the non-empty paths
+    """
+    return [path for path in paths.split(os.pathsep) if path]
+
+# Messages reported by the script for the errors raised by `generate_all`, by exception class
+# (`Exception` being the fallback for any other error)
+_REPORTERS = {
+    ValueError:         lambda e: 'Unable to generate interface - {}'.format(e),
+    FileExistsError:    lambda e: 'Destination or documentation folder does not exist',
+    NotADirectoryError: lambda e: 'Destination or documentation folder is a file',
+    OSError:            lambda e: 'Unable to create folders or files - {}'.format(e),
+    subprocess.CalledProcessError: lambda e: (
+        'The specified clang does not appear to be a valid clang executable' if e.returncode == 0
+        else 'Clang returned as error - return code {}'.format(e.returncode)),
+    Exception:          lambda e: 'An unknown error occurred: {}'.format(e),
+}
+
+@functools.cache
+def _build_parser():
+    """
+    Build the parser for the command line arguments of the script; built once, when first needed
+
+    :return: The `argparse.ArgumentParser`
+    """
     import argparse
-    import sys
 
     parser = argparse.ArgumentParser(description="Script to generate the export interface for a GDExtension from the C++ source files")
     parser.add_argument("--license", help="Print the license information and quit", action="store_true")
@@ -589,9 +1060,9 @@ if __name__ == "__main__":
     group.add_argument("--no-godot", action='store_const', dest='godot', const=None,
                        help="Don't automatically calculate include folders from godot-cpp repo directory")
     parser.add_argument("--clang", "-c", metavar="EXE", help="Path to the clang executable to use", default="clang")
-    parser.add_argument("--isystem", "-s", metavar="DIR", action="append", default=[],
+    parser.add_argument("--isystem", "-s", metavar="DIR", action="extend", type=_split_paths, default=[],
                         help="List of paths to treat as system include directories; i.e., -isystem paths to clang")
-    parser.add_argument("--include", "-I", metavar="DIR", action="append", default=[],
+    parser.add_argument("--include", "-I", metavar="DIR", action="extend", type=_split_paths, default=[],
                         help="List of paths to treat as system include directories; i.e., -I paths to clang")
     parser.add_argument("--output", "-o", metavar="DIR", help="Specifies the output directory (default = current working directory)")
     parser.add_argument("--doc", "-d", metavar="DIR", nargs="?", default=None, const="",
@@ -600,21 +1071,38 @@ if __name__ == "__main__":
                         help="Specifies to create output and doc folder if they don't exist")
     parser.add_argument("--quiet", "-q", action="store_true", default=False,
                         help="Don't output informational status messages")
+    parser.add_argument("--jobs", "-j", metavar="N", type=_positive_int, default=None,
+                        help="Maximum number of clang processes to run in parallel (default = number of CPUs)")
+    parser.add_argument("--cache", metavar="DIR", nargs="?", default=None, const="",
+                        help="Specifies to cache generated files in the specified folder, and reuse them for unchanged header files (~/.cache/gdexport if no argument specified)")
+    parser.add_argument("--pch", action="store_true", default=False,
+                        help="Precompile the godot-cpp headers once and reuse them for every header file")
+    parser.add_argument("--incremental", action="store_true", default=False,
+                        help="Skip header files whose generated file is up to date (ignored with --doc)")
     parser.add_argument("--clang-arg", "-a", metavar="ARG", action="append", default=[],
                         help="Specifies that the next argument should be passed as an extra argument to clang")
     parser.add_argument("name", help="Name of the GDExtension. Used for generating the entry_symbol name '<name>_library_init'")
     parser.add_argument("file", nargs='+', help="List of C++ header files to process to export Godot classes from")
-    args = parser.parse_args()
+    return parser
+
+def main(argv : list[str]|None = None):
+    """
+    Run the script with the specified command line arguments
+
+    :param list[str]|None argv: The command line arguments, excluding the program name
+                                (default = `None` to use `sys.argv`)
+    """
+    import sys
+
+    args = _build_parser().parse_args(argv)
 
     if args.license:
-        if __package__ is None:
-            print(resources.files("LICENSE.md").read_text())
-        else:
-            print((resources.files(__package__) / "LICENSE.md").read_text())
-        exit(0)
+        print(_license_text())
+        sys.exit(0)
 
     if not validate_name(args.name):
         print('Specified name is not a valid C++ identifier', file=sys.stderr)
+        return
 
     try:
         generate_all(args.name,
@@ -627,19 +1115,15 @@ if __name__ == "__main__":
                         documentation = args.doc,
                         create_folders = args.make_dirs,
                         quiet = args.quiet,
-                        args = args.clang_arg)
-    except ValueError as e:
-        print('Unable to generate interface - {}'.format(e), file=sys.stderr)
-    except FileExistsError as e:
-        print('Destination or documentation folder does not exist', file=sys.stderr)
-    except NotADirectoryError as e:
-        print('Destination or documentation folder is a file', file=sys.stderr)
-    except OSError as e:
-        print('Unable to create folders or files - {}'.format(e), file=sys.stderr)
-    except subprocess.CalledProcessError as e:
-        if e.returncode == 0:
-            print('The specified clang does not appear to be a valid clang executable', file=sys.stderr)
-        else:
-            print('Clang returned as error - return code {}'.format(e.returncode), file=sys.stderr)
-    except BaseException as e:
-        print('An unknown error occurred: {}'.format(e))
+                        args = args.clang_arg,
+                        jobs = args.jobs,
+                        cache = args.cache,
+                        precompile = args.pch,
+                        incremental = args.incremental)
+    except Exception as e:
+        # Report with the message for the most derived exception class which has one
+        report = next(_REPORTERS[x] for x in type(e).__mro__ if x in _REPORTERS)
+        print(report(e), file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
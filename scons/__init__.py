@@ -18,4 +18,11 @@ __license__ = "ZLib"
 __version__ = "0.1.0"
 __status__ = "Development"
 
-from .scons import configure_generate
+__all__ = ["configure_generate"]
+
+def __getattr__(name):
+    # Import the builder module on first use, rather than whenever the package is imported
+    if name == "configure_generate":
+        from .scons import configure_generate
+        return configure_generate
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
@@ -21,6 +21,29 @@ __status__ = "Development"
 from .. import gdexport
 from SCons.Builder import Builder
 import pathlib
+import os
+
+# Documentation files listed by `gdexport.list_doc_files` for the doc emitter, keyed by the
+# header files (with their modification times) and the options; so SCons exploring the
+# dependency graph again, or several environments configured for the same headers, do not
+# run clang again for unchanged headers
+_doc_files : dict[tuple,list[str]] = {}
+
+def _list_doc_files(files, godot, clang, sysincludes, includes, documentation, args) -> list[str]:
+    """
+    Gets the list of XML documentation files which will be generated for the specified header files
+    (see `gdexport.list_doc_files`), reusing the list if already listed for the unchanged files
+    """
+    paths = tuple(str(x) for x in files)
+    # Check the files before reading their times for the key, so errors are reported as documented
+    gdexport._check_files(paths)
+    key = (paths, tuple(os.stat(x).st_mtime_ns for x in paths), godot, clang,
+           tuple(str(x) for x in sysincludes), tuple(str(x) for x in includes or ()),
+           documentation, tuple(args or ()))
+    if key not in _doc_files:
+        _doc_files[key] = gdexport.list_doc_files(paths, godot, clang, sysincludes,
+                                                  includes, documentation, args)
+    return _doc_files[key]
 
 def configure_generate(env,
                        name           : str,
@@ -28,10 +51,11 @@ def configure_generate(env,
                        godot          : str|None       = None,
                        clang          : str            = "clang",
                        sysincludes    : list[str]|None = None,
-                       includes       : list[str]      = [],
+                       includes       : list[str]|None = None,
                        destination    : str|None       = None,
                        documentation  : str|None       = None,
-                       args           : list[str]      = []):
+                       args           : list[str]|None = None,
+                       batch          : bool           = False):
     """
     Create SCon builders and add build steps to generate C++ files to perform the necessary export
     for GDExension for the specified C++ header files.
@@ -64,6 +88,11 @@ def configure_generate(env,
                                    location (`doc_classes` in current working),
                                    or path to directory to generate in otherwise
     :param list[str] args:         List of extra command line arguments to pass to clang
+    :param bool batch:             Specify whether to generate all the files with a single build step,
+                                   which calls `gdexport.generate_all` once for all the header files
+                                   (so clang is run in batches and in parallel), rather than a build
+                                   step per header file. Note that all the files are then generated
+                                   again when any of the header files changes
 
     :raises ValueError:         If name is not a valid C++ identifier (valid identifier
                                 contains only [a-zA-Z0-9_] and cannot start with a number)
@@ -97,8 +126,7 @@ def configure_generate(env,
         documentation = "doc_classes"
     if documentation and (env["target"] in ["editor", "template_debug"]):
         def doc_emitter_func(env, target, source):
-            target += gdexport.list_doc_files(source, godot, clang, sysincludes,
-                                              includes, documentation, args)
+            target += _list_doc_files(source, godot, clang, sysincludes, includes, documentation, args)
             return target,source
         doc_emitter = doc_emitter_func
 
@@ -121,6 +149,22 @@ def configure_generate(env,
     else:
         dest = pathlib.Path()
 
+    if batch:
+        def gdexport_generate_all(env,target,source):
+            # Quiet like the per-header steps, and run no more clang processes than SCons' own jobs
+            gdexport.generate_all(name, [str(x) for x in source], godot=godot, clang=clang,
+                                  sysincludes=sysincludes, includes=includes, destination=str(dest),
+                                  documentation=documentation, create_folders=True, quiet=True,
+                                  args=args, jobs=env.GetOption("num_jobs"))
+
+        headers = [dest/(pathlib.Path(str(x)).stem+'.gen.cpp') for x in files]
+        docs = _list_doc_files(files, godot, clang, sysincludes, includes, documentation, args) if doc_emitter else []
+        targets = env.Command(headers + [dest/(name+'.lib.cpp')] + docs, files, gdexport_generate_all)
+        sources = targets[:len(files)+1]
+        if docs:
+            sources += env.GodotCPPDocData(dest/(name+".doc.cpp"), source=targets[len(files)+1:])
+        return sources
+
     if documentation and (env["target"] in ["editor", "template_debug"]):
         sources = []
         docs = []